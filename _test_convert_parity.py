@@ -0,0 +1,43 @@
+# Parity smoke check: the vectorized build_rows (numba kernel when numba is
+# installed, pandas masks otherwise) must produce the same proj_points as the
+# per-player reference build_rows_python for every tier/fallback shape.
+import math
+import convert_json_to_csv as mod
+
+def s(period=..., split=None, source=None, total=..., applied=None):
+    d = {}
+    if period is not ...:
+        d["scoringPeriodId"] = period
+    if split is not None:
+        d["statSplitTypeId"] = split
+    if source is not None:
+        d["statSourceId"] = source
+    if total is not ...:
+        d["appliedTotal"] = total
+    if applied is not None:
+        d["appliedStats"] = applied
+    return d
+
+players = [
+    {"id": 1, "fullName": "season tier1", "stats": [s(0, 0, 1, 182.62), s(0, 2, 1, 25.33)]},
+    {"id": 2, "fullName": "tier1 valueless -> weekly, not tier2", "stats": [
+        s(0, 0, 1), s(0, 2, 1, 25.33), s(1, 1, 1, 10.0), s(2, 1, 1, 12.5)]},
+    {"id": 3, "fullName": "tier2 split", "stats": [s(0, 2, 1, 99.0), s(0, 0, 0, 55.0)]},
+    {"id": 4, "fullName": "tier3 season actuals", "stats": [s(0, 0, 0, 55.0)]},
+    {"id": 5, "fullName": "weekly projections", "stats": [s(1, 1, 1, 7.0), s(2, 1, 1, 8.0), s(1, 1, 0, 99.0)]},
+    {"id": 6, "fullName": "weekly actuals", "stats": [s(1, 1, 0, 3.0), s(2, 1, 0, 4.0)]},
+    {"id": 7, "fullName": "missing period is junk, not season", "stats": [
+        s(None, 0, 1, 500.0), {"statSplitTypeId": 0, "statSourceId": 1, "appliedTotal": 400.0}, s(1, 1, 1, 6.0)]},
+    {"id": 8, "fullName": "appliedStats sum", "stats": [s(0, 0, 1, None, {"53": 1.5, "x": "bad", "1": 2.0})]},
+    {"id": 9, "fullName": "tier1 valueless, no weekly", "stats": [s(0, 0, 1), s(0, 2, 1, 77.0)]},
+    {"id": 10, "fullName": "no stats", "stats": []},
+]
+
+fast = mod.build_rows(players, 2025)["proj_points"].tolist()
+ref = [r["proj_points"] for r in mod.build_rows_python(players, 2025)]
+assert len(fast) == len(ref)
+for i, (a, b) in enumerate(zip(fast, ref)):
+    a_nan = a is None or (isinstance(a, float) and math.isnan(a))
+    b_nan = b is None or (isinstance(b, float) and math.isnan(b))
+    assert (a_nan and b_nan) or abs(float(a) - float(b)) < 1e-9, (i + 1, a, b)
+print("parity OK", "(numba kernel)" if mod.HAS_NUMBA else "(mask path)")
@@ -1,4 +1,6 @@
-﻿import pandas as pd
+﻿# pandas is required here: the draft helper's scoring functions take and
+# return DataFrames, so this smoke check exercises that API directly.
+import pandas as pd
 import draft_helper_step2_vorp as mod
 
 df = pd.DataFrame({
@@ -1,7 +1,26 @@
-﻿from draft_helper_step2_vorp import write_state, read_state
-from collections import defaultdict
+import os
+import numpy as np
+from draft_helper_step2_vorp import write_state, read_state, append_state_action, POS_IDX
 p = '_state_test.json'
-write_state(p, 'players.csv', 10, {'RB':2}, {'RB':3}, {'need':1.0,'bench':0.4,'blocked':0.1}, 15, [('drafted','John Doe','RB'), ('mine','My Guy','WR')], defaultdict(int, {'RB':1,'WR':1,'FLEX':0}))
+mc = np.zeros(len(POS_IDX), dtype=np.int8)
+mc[POS_IDX['RB']] = 1
+mc[POS_IDX['WR']] = 1
+write_state(p, 'players.csv', 10, {'RB':2}, {'RB':3}, {'need':1.0,'bench':0.4,'blocked':0.1}, 15, [('drafted','John Doe','RB'), ('mine','My Guy','WR')], mc)
 print('wrote')
 st = read_state(p)
 print(st['csv'], st['teams'], len(st['drafted']), st['my_counts']['RB'])
+
+# Orphan log: a first session killed before any clean quit leaves only
+# <state>.log -- read_state must replay it onto an empty state
+p2 = '_state_orphan.json'
+for f in (p2, p2 + '.log'):
+    if os.path.exists(f):
+        os.remove(f)
+append_state_action(p2, 'drafted', 'John Doe', 'RB')
+append_state_action(p2, 'mine', 'My Guy', 'WR', bucket='WR')
+append_state_action(p2, 'drafted', 'Oops', 'TE')
+append_state_action(p2, 'undo', 'Oops', 'TE')
+st2 = read_state(p2)
+assert len(st2['drafted']) == 2, st2['drafted']
+assert st2['my_counts']['WR'] == 1, st2['my_counts']
+print('orphan log replayed:', len(st2['drafted']), 'actions,', st2['my_counts'])
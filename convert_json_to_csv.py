@@ -1,25 +1,91 @@
-import sys, json, pandas as pd, io
+import sys, os, json, pandas as pd, numpy as np, io
+
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
+try:
+    from numba import njit  # type: ignore
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
+try:
+    import ijson  # type: ignore
+    HAS_IJSON = True
+except Exception:
+    HAS_IJSON = False
+
+try:
+    import simdjson  # type: ignore
+    HAS_SIMDJSON = True
+except Exception:
+    HAS_SIMDJSON = False
 
 USAGE = "python convert_json_to_csv.py <input.json> <output.csv> [season]"
 
+def _loads(buf):
+    # orjson parses bytes directly and is much faster on these multi-MB dumps
+    if HAS_ORJSON:
+        return orjson.loads(buf)
+    if isinstance(buf, bytes):
+        buf = buf.decode("utf-8")
+    return json.loads(buf)
+
+def _advise_sequential(f):
+    # Ask the kernel to read ahead aggressively: these dumps are consumed
+    # front to back in one shot, so prefetching overlaps disk I/O with parsing
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+    except (AttributeError, OSError):
+        pass  # non-POSIX platform (Windows) or exotic fs; plain reads are fine
+
 def load_any(path):
-    # Try JSON array/object first
-    with open(path, "r", encoding="utf-8") as f:
-        txt = f.read()
+    # Stream top-level arrays with ijson when available: player records are
+    # yielded incrementally, so the raw text and a full parse tree never
+    # coexist in memory on multi-hundred-MB dumps.
+    if HAS_IJSON:
+        with open(path, "rb") as f:
+            head = f.read(64).lstrip()
+        if head[:1] == b"[":
+            try:
+                with open(path, "rb") as f:
+                    _advise_sequential(f)
+                    # use_float: match the other loaders' int/float types --
+                    # ijson's default Decimal would fail the isinstance
+                    # (int, float) gates in the stats-summing fallbacks
+                    return list(ijson.items(f, "item", use_float=True))
+            except Exception:
+                pass  # malformed mid-stream; retry with the buffered path
+    # Buffered JSON array/object
+    with open(path, "rb") as f:
+        _advise_sequential(f)
+        raw = f.read()
     try:
-        data = json.loads(txt)
+        data = _loads(raw)
         # Some responses may be {"players":[...]} – normalize
         if isinstance(data, dict) and "players" in data and isinstance(data["players"], list):
             return data["players"]
         return data
     except Exception:
-        # Fallback: NDJSON (one JSON per line)
+        # Fallback: NDJSON (one JSON per line). With pysimdjson installed a
+        # single Parser instance is reused for every line so its internal
+        # buffers are allocated once instead of per record.
+        parser = simdjson.Parser() if HAS_SIMDJSON else None
         rows = []
-        for line in io.StringIO(txt):
+        for line in io.BytesIO(raw):
             line = line.strip()
             if not line:
                 continue
-            rows.append(json.loads(line))
+            if parser is not None:
+                doc = parser.parse(line)
+                # materialize before the next parse() invalidates the proxy
+                rows.append(doc.as_dict() if hasattr(doc, "as_dict") else doc)
+            else:
+                rows.append(_loads(line))
         return rows
 
 def pick_season_projection(stats):
@@ -30,31 +96,25 @@ def pick_season_projection(stats):
     """
     if not isinstance(stats, list):
         return None
-    # Primary: season aggregate projections
-    for s in stats:
-        if (
-            s.get("scoringPeriodId") == 0
-            and s.get("statSplitTypeId") in (0, "0")
-            and s.get("statSourceId") in (1, "1")
-        ):
-            return s
-    # Back-compat: rare feeds may use splitTypeId 2
-    for s in stats:
-        if (
-            s.get("scoringPeriodId") == 0
-            and s.get("statSplitTypeId") in (2, "2")
-            and s.get("statSourceId") in (1, "1")
-        ):
-            return s
-    # Last resort season actuals (sourceId 0)
+    # Single pass: return the primary tier (season aggregate projections)
+    # as soon as it is seen, remembering the first fallback candidate of
+    # each lower tier along the way instead of rescanning the list.
+    split2 = actuals = None
     for s in stats:
-        if (
-            s.get("scoringPeriodId") == 0
-            and s.get("statSplitTypeId") in (0, 2, "0", "2")
-            and s.get("statSourceId") in (0, "0")
-        ):
-            return s
-    return None
+        if s.get("scoringPeriodId") != 0:
+            continue
+        split_id = s.get("statSplitTypeId")
+        source_id = s.get("statSourceId")
+        if source_id in (1, "1"):
+            if split_id in (0, "0"):
+                return s
+            # Back-compat: rare feeds may use splitTypeId 2
+            if split2 is None and split_id in (2, "2"):
+                split2 = s
+        # Last resort season actuals (sourceId 0)
+        elif actuals is None and source_id in (0, "0") and split_id in (0, 2, "0", "2"):
+            actuals = s
+    return split2 if split2 is not None else actuals
 
 def get_applied_points(sp):
     """
@@ -77,16 +137,146 @@ def get_applied_points(sp):
             return total
     return None
 
-def main():
-    if len(sys.argv) < 3:
-        print(USAGE); sys.exit(1)
-    in_path, out_path = sys.argv[1], sys.argv[2]
-    season = int(sys.argv[3]) if len(sys.argv) > 3 else 2025
+def _applied_stats_sum(applied):
+    # Sum of numeric appliedStats values, or None if nothing numeric
+    if not isinstance(applied, dict):
+        return None
+    total = 0.0
+    has_num = False
+    for v in applied.values():
+        if isinstance(v, (int, float)):
+            total += float(v)
+            has_num = True
+    return total if has_num else None
 
-    data = load_any(in_path)
-    if not isinstance(data, list):
-        print("Input is not a JSON array of players.", file=sys.stderr); sys.exit(2)
+def _pick_points_kernel(ix, period, split, source, applied, n):
+    """
+    Single-pass tier selection over struct-of-arrays stat columns.
+    Records the first stat entry per tier per player, then resolves
+    tiers in the same order as the pandas-mask path. Numba-compiled
+    when numba is installed.
+    """
+    t1 = np.full(n, np.nan)
+    t2 = np.full(n, np.nan)
+    t3 = np.full(n, np.nan)
+    seen = np.zeros((3, n), np.bool_)
+    wk_proj = np.zeros(n)
+    has_wk_proj = np.zeros(n, np.bool_)
+    wk_act = np.zeros(n)
+    has_wk_act = np.zeros(n, np.bool_)
+    for j in range(ix.shape[0]):
+        i = ix[j]
+        pe, sp, so, ap = period[j], split[j], source[j], applied[j]
+        if pe == 0 and (sp == 0 or sp == 2):
+            if so == 1:
+                if sp == 0:
+                    if not seen[0, i]:
+                        seen[0, i] = True
+                        t1[i] = ap
+                elif not seen[1, i]:
+                    seen[1, i] = True
+                    t2[i] = ap
+            elif so == 0:
+                if not seen[2, i]:
+                    seen[2, i] = True
+                    t3[i] = ap
+        elif pe >= 1 and sp == 1:
+            if so == 1:
+                has_wk_proj[i] = True
+                if ap == ap:
+                    wk_proj[i] += ap
+            elif so == 0:
+                has_wk_act[i] = True
+                if ap == ap:
+                    wk_act[i] += ap
+    out = np.full(n, np.nan)
+    for i in range(n):
+        # Entry presence picks the season tier (a valueless tier-1 entry
+        # still blocks lower tiers); only a missing value falls through
+        # to the weekly sums -- same as pick_season_projection
+        if seen[0, i]:
+            out[i] = t1[i]
+        elif seen[1, i]:
+            out[i] = t2[i]
+        elif seen[2, i]:
+            out[i] = t3[i]
+        if out[i] != out[i]:
+            if has_wk_proj[i]:
+                out[i] = wk_proj[i]
+            elif has_wk_act[i]:
+                out[i] = wk_act[i]
+    return out
 
+if HAS_NUMBA:
+    _pick_points_kernel = njit(cache=True)(_pick_points_kernel)
+
+def build_rows(data, season):
+    """
+    Vectorized version of the per-player loop in build_rows_python:
+    flatten every stats entry with one pd.json_normalize pass, then pick
+    each player's projection tier with boolean masks instead of nested loops.
+    With numba installed the tier selection runs as a compiled single-pass
+    kernel over struct-of-arrays columns instead.
+    """
+    players = [p for p in data if isinstance(p, dict)]
+    df = pd.DataFrame({
+        "player_id": [p.get("id") for p in players],
+        "name": [p.get("fullName") for p in players],
+        "position_id": [p.get("defaultPositionId") for p in players],
+        "team_id": [p.get("proTeamId") for p in players],
+    })
+    df["season"] = season
+
+    slim = [{"_ix": i, "stats": p.get("stats") if isinstance(p.get("stats"), list) else []}
+            for i, p in enumerate(players)]
+    stats = pd.json_normalize(slim, record_path="stats", meta=["_ix"], max_level=0)
+    pts = pd.Series(index=df.index, dtype=float)
+    if not stats.empty:
+        ix = stats["_ix"].astype(int)
+        # NaN period must stay NaN: entries without a scoringPeriodId are
+        # junk, not season (period-0) entries, and NaN == 0 is False below
+        period = pd.to_numeric(stats.get("scoringPeriodId"), errors="coerce")
+        split = pd.to_numeric(stats.get("statSplitTypeId"), errors="coerce")
+        source = pd.to_numeric(stats.get("statSourceId"), errors="coerce")
+        applied = pd.to_numeric(stats.get("appliedTotal"), errors="coerce")
+        if "appliedStats" in stats.columns:
+            applied = applied.fillna(stats["appliedStats"].map(_applied_stats_sum, na_action="ignore"))
+
+        if HAS_NUMBA:
+            out = _pick_points_kernel(
+                ix.to_numpy(np.int64),
+                period.to_numpy(np.float64),  # NaN for missing ids: matches no tier
+                split.fillna(-1).to_numpy(np.float64),
+                source.fillna(-1).to_numpy(np.float64),
+                applied.to_numpy(np.float64),
+                len(players),
+            )
+            df["proj_points"] = out
+            return df
+
+        def first_per_player(mask):
+            sel = stats.index[mask]
+            keep = ~ix[sel].duplicated()
+            return pd.Series(applied[sel[keep]].values, index=ix[sel[keep]].values)
+
+        # Tier choice follows entry *presence*, as pick_season_projection
+        # returns the first tier-1 entry even when its points are missing:
+        # a lower season tier never fills in for a present-but-valueless
+        # higher one -- only the weekly fallback does.
+        season_pts = first_per_player((period == 0) & (split == 0) & (source == 1))
+        for tier in (first_per_player((period == 0) & (split == 2) & (source == 1)),
+                     first_per_player((period == 0) & split.isin([0, 2]) & (source == 0))):
+            season_pts = pd.concat([season_pts, tier[~tier.index.isin(season_pts.index)]])
+        pts = pts.fillna(season_pts)
+        weekly_proj = applied[(split == 1) & (source == 1) & (period >= 1)].groupby(ix).sum()
+        weekly_act = applied[(split == 1) & (source == 0) & (period >= 1)].groupby(ix).sum()
+        pts = pts.fillna(weekly_proj).fillna(weekly_act)
+
+    df["proj_points"] = pts
+    return df
+
+def build_rows_python(data, season):
+    # Per-player fallback kept for payload shapes json_normalize chokes on
     rows = []
     for p in data:
         if not isinstance(p, dict): 
@@ -125,8 +315,22 @@ def main():
             "season": season,
             "proj_points": pts
         })
+    return rows
 
-    df = pd.DataFrame(rows)
+def main():
+    if len(sys.argv) < 3:
+        print(USAGE); sys.exit(1)
+    in_path, out_path = sys.argv[1], sys.argv[2]
+    season = int(sys.argv[3]) if len(sys.argv) > 3 else 2025
+
+    data = load_any(in_path)
+    if not isinstance(data, list):
+        print("Input is not a JSON array of players.", file=sys.stderr); sys.exit(2)
+
+    try:
+        df = build_rows(data, season)
+    except Exception:
+        df = pd.DataFrame(build_rows_python(data, season))
     # Keep rows even if proj_points is NaN so you can inspect what’s missing
     df.to_csv(out_path, index=False)
     print(f"Wrote {out_path} with {len(df)} rows; "
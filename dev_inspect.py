@@ -1,7 +1,16 @@
 import json, collections
 
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
 path = 'espn_projections_2025.json'
-d = json.load(open(path, 'r', encoding='utf-8'))
+if HAS_ORJSON:
+    d = orjson.loads(open(path, 'rb').read())
+else:
+    d = json.load(open(path, 'r', encoding='utf-8'))
 
 print('records:', len(d))
 
@@ -27,12 +36,21 @@ for p in d:
     stats = p.get('stats') or []
     if not isinstance(stats, list):
         stats = []
-    # season projections
-    season = next((s for s in stats if s.get('scoringPeriodId')==0 and s.get('statSplitTypeId') in (0,'0',2,'2') and s.get('statSourceId') in (1,'1')), None)
-    weekly = [s for s in stats if s.get('statSplitTypeId') in (1,'1') and s.get('statSourceId') in (1,'1') and (s.get('scoringPeriodId') or 0) >= 1]
+    # single pass: first season-projection entry + weekly projection sum together
+    season = None
+    weekly_sum = 0.0
+    has_weekly = False
+    for s in stats:
+        if s.get('statSourceId') not in (1,'1'):
+            continue
+        if season is None and s.get('scoringPeriodId')==0 and s.get('statSplitTypeId') in (0,'0',2,'2'):
+            season = s
+        elif s.get('statSplitTypeId') in (1,'1') and (s.get('scoringPeriodId') or 0) >= 1:
+            weekly_sum += apptotal(s) or 0.0
+            has_weekly = True
     val = apptotal(season)
-    if val is None and weekly:
-        val = sum(apptotal(s) or 0.0 for s in weekly)
+    if val is None and has_weekly:
+        val = weekly_sum
     if val is None:
         missing += 1
     else:
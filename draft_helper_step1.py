@@ -20,10 +20,17 @@ If your file uses different names, use --col-* overrides.
 """
 
 import argparse
+import os
 import sys
 import pandas as pd
 from difflib import get_close_matches
 
+try:
+    from rapidfuzz import process as rf_process  # type: ignore
+    HAS_RAPIDFUZZ = True
+except Exception:
+    HAS_RAPIDFUZZ = False
+
 COL_PLAYER_CANDIDATES = ["player","name","full_name","fullName"]
 COL_POS_CANDIDATES = ["pos","position"]
 COL_POINTS_CANDIDATES = ["proj_points","projected","projected_points","points","fp","fpts"]
@@ -31,29 +38,42 @@ COL_POINTS_CANDIDATES = ["proj_points","projected","projected_points","points","
 def normalize_columns(df):
     mapping = {}
     cols_lower = {c.lower(): c for c in df.columns}
-    # player
-    for k in COL_PLAYER_CANDIDATES:
-        if k.lower() in cols_lower:
-            mapping['player'] = cols_lower[k.lower()]
-            break
-    # position
-    for k in COL_POS_CANDIDATES:
-        if k.lower() in cols_lower:
-            mapping['position'] = cols_lower[k.lower()]
-            break
-    # points
-    for k in COL_POINTS_CANDIDATES:
-        if k.lower() in cols_lower:
-            mapping['proj_points'] = cols_lower[k.lower()]
-            break
+    # Intersect each candidate list with the header in one set operation,
+    # then keep candidate-list priority among whatever actually matched
+    for canon, candidates in (('player', COL_PLAYER_CANDIDATES),
+                              ('position', COL_POS_CANDIDATES),
+                              ('proj_points', COL_POINTS_CANDIDATES)):
+        hits = cols_lower.keys() & {k.lower() for k in candidates}
+        if hits:
+            best = next(k.lower() for k in candidates if k.lower() in hits)
+            mapping[canon] = cols_lower[best]
     missing = [k for k in ['player','position','proj_points'] if k not in mapping]
     if missing:
         raise ValueError(f"Could not auto-detect columns for: {missing}. "
                          f"Use --col-player/--col-pos/--col-points to specify manually.")
     return mapping
 
+def read_csv_cached(path):
+    """
+    Read the players CSV, keeping a Feather sidecar cache (<csv>.feather) so
+    repeat launches skip CSV parsing. Falls back silently to plain read_csv
+    if pyarrow is unavailable or the cache is stale/unwritable.
+    """
+    cache = path + ".feather"
+    try:
+        if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(path):
+            return pd.read_feather(cache)
+    except Exception:
+        pass
+    df = pd.read_csv(path)
+    try:
+        df.to_feather(cache)
+    except Exception:
+        pass
+    return df
+
 def load_data(args):
-    df = pd.read_csv(args.csv)
+    df = read_csv_cached(args.csv)
     if args.col_player and args.col_player not in df.columns:
         raise ValueError(f"--col-player '{args.col_player}' not found in CSV columns: {list(df.columns)}")
     if args.col_pos and args.col_pos not in df.columns:
@@ -74,30 +94,74 @@ def load_data(args):
     })
     # Clean types
     df['player'] = df['player'].astype(str).str.strip()
-    df['position'] = df['position'].astype(str).str.upper().str.strip()
+    # Categorical position: a handful of codes repeated thousands of times,
+    # so filters/groupbys compare int8 codes instead of strings
+    df['position'] = df['position'].astype(str).str.upper().str.strip().astype('category')
     # Coerce points to numeric
     df['proj_points'] = pd.to_numeric(df['proj_points'], errors='coerce')
     df = df.dropna(subset=['proj_points'])
-    # Remove duplicates on (player, position) keeping max proj_points
-    df = df.sort_values('proj_points', ascending=False).drop_duplicates(subset=['player','position'], keep='first')
+    # Remove duplicates on (player, position) keeping max proj_points:
+    # idxmax per group beats pre-sorting the whole frame just to dedup
+    best = df.groupby(['player','position'], sort=False, observed=True)['proj_points'].idxmax()
+    df = df.loc[best].sort_values('proj_points', ascending=False)
     df = df.reset_index(drop=True)
     return df
 
-def show_top(df, drafted, topn):
-    available = df[~df['player'].isin(drafted)].sort_values('proj_points', ascending=False)
-    top = available.head(topn).copy()
+def write_csv_fast(df, path):
+    """
+    Write a CSV with pyarrow's batch writer when available (several times
+    faster than DataFrame.to_csv on big pools); otherwise fall back.
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+    except Exception:
+        df.to_csv(path, index=False)
+
+def suggest_names(query, names, n=5, cutoff=0.6):
+    """
+    Close-match suggestions for a misspelled name. Uses rapidfuzz when
+    installed (C-accelerated, ~10-100x difflib); otherwise difflib.
+    """
+    if HAS_RAPIDFUZZ:
+        hits = rf_process.extract(query, names, limit=n, score_cutoff=cutoff * 100)
+        return [name for name, _score, _idx in hits]
+    return get_close_matches(query, names, n=n, cutoff=cutoff)
+
+def make_display(df):
+    """Pre-format the table shown by show_top so each keystroke only slices
+    and prints; the per-row float formatting happens once at startup."""
+    return df[['player','position']].assign(proj_points=df['proj_points'].map('{:.2f}'.format))
+
+def show_top(df, display, drafted_ids, topn):
+    # df is already sorted by proj_points descending (load_data), so dropping
+    # the drafted rows by index is O(drafted) instead of scanning every name
+    drop_idx = list(drafted_ids)
+    available = df.drop(index=drop_idx)
+    top = display.drop(index=drop_idx).head(topn)
     if top.empty:
         print("\nNo players left. Draft complete.")
         return False
     print("\nBest available (by projected points):")
-    print(top[['player','position','proj_points']].to_string(index=False,
-          formatters={'proj_points': lambda x: f'{x:.2f}'}))
-    # also show best by position (top 3 each) for quick scanning
+    print(top.to_string(index=False))
+    # also show best by position (top 3 each) for quick scanning; the pool is
+    # already sorted, so one forward pass collects each position's top 3 and
+    # stops as soon as every position present is filled -- no groupby needed
     print("\nBy position (top 3 each):")
-    for pos, grp in available.groupby('position'):
-        g = grp.head(3)[['player','proj_points']]
-        if not g.empty:
-            print(f"  {pos:>4}: " + ", ".join([f\"{r.player} ({r.proj_points:.1f})\" for r in g.itertuples()]))
+    n_pos = len(df['position'].cat.categories) if hasattr(df['position'], 'cat') else df['position'].nunique()
+    by_pos = {}
+    filled = 0
+    for name, pos, pts in zip(available['player'], available['position'], available['proj_points']):
+        entries = by_pos.setdefault(pos, [])
+        if len(entries) < 3:
+            entries.append(f"{name} ({pts:.1f})")
+            if len(entries) == 3:
+                filled += 1
+                if filled == n_pos:
+                    break
+    for pos in sorted(by_pos):
+        print(f"  {pos:>4}: " + ", ".join(by_pos[pos]))
     return True
 
 def main():
@@ -115,54 +179,60 @@ def main():
         print(f"ERROR: {e}")
         sys.exit(1)
 
-    all_names = df['player'].tolist()
-    drafted = set()
+    # Intern names once: membership and lookups then hash/compare by pointer,
+    # and the drafted set itself holds small int row ids rather than strings
+    all_names = [sys.intern(n) for n in df['player'].tolist()]
+    row_of = {name: i for i, name in enumerate(all_names)}
+    display = make_display(df)
+    drafted = set()   # row ids (ints)
 
     print(f"Loaded {len(df)} players from {args.csv}.")
     print("Enter drafted player names one per line. Type ':undo' to undo last draft, ':save PATH' to save remaining, ':quit' to exit.\n")
 
     history = []
-    if not show_top(df, drafted, args.top):
+    if not show_top(df, display, drafted, args.top):
         return
 
     while True:
         line = input("\nDrafted> ").strip()
         if not line:
             continue
-        if line.lower() in (':q', ':quit', ':exit'):
+        low = line.lower()
+        if low in (':q', ':quit', ':exit'):
             break
-        if line.lower() == ':undo':
+        if low == ':undo':
             if history:
                 last = history.pop()
-                drafted.remove(last)
+                drafted.remove(row_of[last])
                 print(f"Undid: {last}")
-                show_top(df, drafted, args.top)
+                show_top(df, display, drafted, args.top)
             else:
                 print("Nothing to undo.")
             continue
-        if line.lower().startswith(':save'):
+        if low.startswith(':save'):
             parts = line.split(maxsplit=1)
             if len(parts) == 2:
                 out = parts[1]
-                remaining = df[~df['player'].isin(drafted)].copy()
-                remaining.to_csv(out, index=False)
+                remaining = df.drop(index=list(drafted))
+                write_csv_fast(remaining, out)
                 print(f"Saved remaining player pool to {out}")
             else:
                 print("Usage: :save /path/to/remaining.csv")
             continue
 
         # Try exact match first
-        if line in drafted:
-            print(f"Already drafted: {line}")
-            continue
-        if line in all_names:
-            drafted.add(line)
-            history.append(line)
-            show_top(df, drafted, args.top)
+        rid = row_of.get(line)
+        if rid is not None:
+            if rid in drafted:
+                print(f"Already drafted: {line}")
+                continue
+            drafted.add(rid)
+            history.append(all_names[rid])
+            show_top(df, display, drafted, args.top)
             continue
 
         # Fuzzy match suggestion
-        suggestion = get_close_matches(line, all_names, n=5, cutoff=0.6)
+        suggestion = suggest_names(line, all_names, n=5, cutoff=0.6)
         if suggestion:
             print(f"Name not found. Did you mean one of: {', '.join(suggestion)} ?")
         else:
@@ -40,9 +40,21 @@ import sys
 import os
 import json
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from difflib import get_close_matches
-from collections import defaultdict
+
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
+try:
+    from numba import njit  # type: ignore
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
 
 COL_PLAYER_CANDIDATES = ["player","name","full_name","fullName"]
 COL_POS_CANDIDATES = ["pos","position"]
@@ -51,6 +63,9 @@ COL_POINTS_CANDIDATES = ["proj_points","projected","projected_points","points","
 DEF_ALIASES = {"DEF","DST","D/ST","D-ST","D\\ST","TEAM DEFENSE","TEAMDEF","TEAM D","DEFENSE"}
 
 BASE_POSITIONS = ["QB","RB","WR","TE","K","DST"]  # FLEX is capacity only
+# my_counts is a fixed int8 array indexed by these codes (positions are a
+# closed enum, so no dict hashing on the per-pick counter updates)
+POS_IDX = {p: i for i, p in enumerate(BASE_POSITIONS + ["FLEX"])}
 
 def parse_kv_list(s, key_type=str, val_type=int):
     """
@@ -73,18 +88,15 @@ def parse_kv_list(s, key_type=str, val_type=int):
 def normalize_columns(df):
     mapping = {}
     cols_lower = {c.lower(): c for c in df.columns}
-    for k in COL_PLAYER_CANDIDATES:
-        if k.lower() in cols_lower:
-            mapping['player'] = cols_lower[k.lower()]
-            break
-    for k in COL_POS_CANDIDATES:
-        if k.lower() in cols_lower:
-            mapping['position'] = cols_lower[k.lower()]
-            break
-    for k in COL_POINTS_CANDIDATES:
-        if k.lower() in cols_lower:
-            mapping['proj_points'] = cols_lower[k.lower()]
-            break
+    # Intersect each candidate list with the header in one set operation,
+    # then keep candidate-list priority among whatever actually matched
+    for canon, candidates in (('player', COL_PLAYER_CANDIDATES),
+                              ('position', COL_POS_CANDIDATES),
+                              ('proj_points', COL_POINTS_CANDIDATES)):
+        hits = cols_lower.keys() & {k.lower() for k in candidates}
+        if hits:
+            best = next(k.lower() for k in candidates if k.lower() in hits)
+            mapping[canon] = cols_lower[best]
     missing = [k for k in ['player','position','proj_points'] if k not in mapping]
     if missing:
         raise ValueError(f"Could not auto-detect columns for: {missing}. "
@@ -92,19 +104,38 @@ def normalize_columns(df):
     return mapping
 
 def load_data(args):
-    df = pd.read_csv(args.csv)
+    # Parquet sidecar cache of the fully-processed pool (canonical columns,
+    # positions normalized, deduped, sorted): repeat launches during a
+    # multi-day draft skip CSV parsing and all the cleanup below. Disabled
+    # when --col-* overrides are given since they change the mapping.
+    cache = args.csv + '.vorp.parquet'
+    use_cache = not (args.col_player or args.col_pos or args.col_points)
+    if use_cache:
+        try:
+            if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(args.csv):
+                return pd.read_parquet(cache)
+        except Exception:
+            pass
+    # Resolve the column mapping from the header alone, then read only the
+    # three needed columns with pinned string dtypes: pandas skips type
+    # inference and never parses the columns we don't use.
+    header = pd.read_csv(args.csv, nrows=0)
     # Column overrides sanity
-    if args.col_player and args.col_player not in df.columns:
-        raise ValueError(f"--col-player '{args.col_player}' not found in CSV columns: {list(df.columns)}")
-    if args.col_pos and args.col_pos not in df.columns:
-        raise ValueError(f"--col-pos '{args.col_pos}' not found in CSV columns: {list(df.columns)}")
-    if args.col_points and args.col_points not in df.columns:
-        raise ValueError(f"--col-points '{args.col_points}' not found in CSV columns: {list(df.columns)}")
+    if args.col_player and args.col_player not in header.columns:
+        raise ValueError(f"--col-player '{args.col_player}' not found in CSV columns: {list(header.columns)}")
+    if args.col_pos and args.col_pos not in header.columns:
+        raise ValueError(f"--col-pos '{args.col_pos}' not found in CSV columns: {list(header.columns)}")
+    if args.col_points and args.col_points not in header.columns:
+        raise ValueError(f"--col-points '{args.col_points}' not found in CSV columns: {list(header.columns)}")
 
     if args.col_player and args.col_pos and args.col_points:
         colmap = {'player': args.col_player, 'position': args.col_pos, 'proj_points': args.col_points}
     else:
-        colmap = normalize_columns(df)
+        colmap = normalize_columns(header)
+
+    df = pd.read_csv(args.csv,
+                     usecols=[colmap['player'], colmap['position'], colmap['proj_points']],
+                     dtype={colmap['player']: str, colmap['position']: str})
 
     # Rename canonical
     df = df.rename(columns={
@@ -114,17 +145,29 @@ def load_data(args):
     })
     # Clean
     df['player'] = df['player'].astype(str).str.strip()
-    # normalize positions
+    # normalize positions: one vectorized set-membership test against the
+    # alias set instead of Series.replace building a 9-entry mapping per load
     df['position'] = df['position'].astype(str).str.upper().str.strip()
-    df['position'] = df['position'].replace({p:'DST' for p in DEF_ALIASES})
-    # limit to known positions if present
+    df.loc[df['position'].isin(DEF_ALIASES), 'position'] = 'DST'
+    # limit to known positions if present; categorical so the hot filters and
+    # groupbys downstream compare int8 codes instead of strings
     df = df[df['position'].isin(set(BASE_POSITIONS))].copy()
-    # Coerce points numeric
-    df['proj_points'] = pd.to_numeric(df['proj_points'], errors='coerce')
+    df['position'] = df['position'].astype('category')
+    # Coerce points numeric; float32 is plenty for one-decimal projections
+    # and halves the bytes every scoring pass moves through cache
+    df['proj_points'] = pd.to_numeric(df['proj_points'], errors='coerce').astype(np.float32)
     df = df.dropna(subset=['proj_points'])
-    # De-dup on (player,position) keeping max
-    df = df.sort_values('proj_points', ascending=False).drop_duplicates(subset=['player','position'], keep='first')
+    # De-dup on (player,position) keeping max: one idxmax per group, then a
+    # single sort of the surviving rows -- fuses the old full-frame
+    # sort + drop_duplicates double pass into one groupby
+    best = df.groupby(['player','position'], sort=False, observed=True)['proj_points'].idxmax()
+    df = df.loc[best].sort_values('proj_points', ascending=False)
     df = df.reset_index(drop=True)
+    if use_cache:
+        try:
+            df.to_parquet(cache)
+        except Exception:
+            pass  # pyarrow missing or dir unwritable; cache is best-effort
     return df
 
 def compute_replacement_points(available_df, teams, starters_by_pos):
@@ -133,50 +176,102 @@ def compute_replacement_points(available_df, teams, starters_by_pos):
     where N = teams * starters_by_pos[pos]. If fewer than N players remain, use the last one's points.
     Returns dict pos->replacement_points (float).
     """
+    # One groupby pass splits the pool per position; each small group array
+    # is then sorted descending so the Nth entry really is the Nth best,
+    # regardless of the caller's row order. (load_data already sorts, making
+    # these per-group sorts nearly free on the hot path.)
+    pools = {pos: np.sort(grp.to_numpy())[::-1]
+             for pos, grp in available_df.groupby('position', observed=True)['proj_points']}
     replacement = {}
     for pos in BASE_POSITIONS:
         N = teams * starters_by_pos.get(pos, 0)
+        pool = pools.get(pos)
         if N <= 0:
             # if no starters for this pos, set low replacement level to avoid picking
             replacement[pos] = float('inf')  # makes vorp negative, pushing it down
-            continue
-        pool = available_df[available_df['position'] == pos].sort_values('proj_points', ascending=False)
-        if pool.empty:
+        elif pool is None or len(pool) == 0:
             replacement[pos] = float('inf')
         else:
             # Nth remaining => zero-based index N-1
             idx = min(max(N-1, 0), len(pool)-1)
-            replacement[pos] = float(pool.iloc[idx]['proj_points'])
+            replacement[pos] = float(pool[idx])
     return replacement
 
-def candidate_scores(available_df, replacement_points, my_needs, weights):
+def _score_kernel(pts, repl, med, std, w):
+    """
+    Fused vorp/z_med/adj_score computation over the candidate arrays in one
+    pass. numba.njit-compiled when numba is installed, which pays off on
+    full-size (several-thousand-row) candidate pools.
+    """
+    n = pts.shape[0]
+    vorp = np.empty(n, pts.dtype)
+    z = np.empty(n, pts.dtype)
+    adj = np.empty(n, pts.dtype)
+    for i in range(n):
+        v = pts[i] - repl[i]
+        vorp[i] = v
+        z[i] = (pts[i] - med[i]) / std[i] if std[i] > 0 else 0.0
+        adj[i] = v * w[i]
+    return vorp, z, adj
+
+if HAS_NUMBA:
+    _score_kernel = njit(cache=True)(_score_kernel)
+
+def candidate_scores(available_df, replacement_points, my_needs, weights, sort=True):
     """
     Compute VORP and adjust by my roster needs.
     my_needs: dict pos->state among {'need','bench','blocked'} giving how we should weight a position.
     weights: dict {'need':1.0, 'bench':0.4, 'blocked':0.1}
     Returns a new DataFrame with columns: player, position, proj_points, vorp, z_med, adj_score, need_state
+    Pass sort=False when only a top-N slice is needed (see top_candidates).
     """
     # Per-position median and std for projected points (std measured around the median)
-    grp = available_df.groupby('position')['proj_points']
+    grp = available_df.groupby('position', observed=True)['proj_points']
     med_series = grp.median()
     # Use population std (ddof=0); ensure no NaNs for singletons
     std_series = grp.std(ddof=0).fillna(0.0)
 
-    rows = []
-    for r in available_df.itertuples(index=False):
-        pos = r.position
-        repl = replacement_points.get(pos, float('inf'))
-        vorp = r.proj_points - repl
-        # z-score relative to the median for this position
-        med_val = float(med_series.get(pos, 0.0))
-        std_val = float(std_series.get(pos, 0.0))
-        z_med = (r.proj_points - med_val) / std_val if std_val > 0 else 0.0
-        state = my_needs.get(pos, 'blocked')
-        w = weights.get(state, 0.1)
+    # Broadcast the per-position lookups onto the rows once, then score the
+    # whole pool with numpy arithmetic instead of a Python itertuples loop
+    # Everything float32 end to end so numpy never upcasts mid-expression
+    pos = available_df['position']
+    pts = available_df['proj_points'].to_numpy(dtype=np.float32)
+    repl = pos.map(replacement_points).fillna(np.inf).to_numpy(dtype=np.float32)
+    med = pos.map(med_series).fillna(0.0).to_numpy(dtype=np.float32)
+    std = pos.map(std_series).fillna(0.0).to_numpy(dtype=np.float32)
+    state = pos.map(my_needs).fillna('blocked')
+    w = state.map(weights).fillna(0.1).to_numpy(dtype=np.float32)
+
+    if HAS_NUMBA:
+        vorp, z_med, adj = _score_kernel(pts, repl, med, std, w)
+    else:
+        vorp = pts - repl
+        z_med = np.where(std > 0, (pts - med) / np.where(std > 0, std, 1.0), 0.0)
         adj = vorp * w
-        rows.append((r.player, pos, r.proj_points, vorp, z_med, adj, state))
-    out = pd.DataFrame(rows, columns=['player','position','proj_points','vorp','z_med','adj_score','need_state'])
-    return out.sort_values(['adj_score','vorp','proj_points'], ascending=[False, False, False]).reset_index(drop=True)
+    out = pd.DataFrame({
+        'player': available_df['player'].to_numpy(),
+        'position': pos.to_numpy(),
+        'proj_points': pts,
+        'vorp': vorp,
+        'z_med': z_med,
+        'adj_score': adj,
+        'need_state': state.to_numpy(),
+    })
+    if sort:
+        out = out.sort_values(['adj_score','vorp','proj_points'], ascending=[False, False, False]).reset_index(drop=True)
+    return out
+
+def top_candidates(scored, n):
+    """
+    Top-n rows by (adj_score, vorp, proj_points) descending. Uses
+    np.argpartition to pull the n best rows in O(rows) and only sorts that
+    slice, instead of sorting the entire scored pool for a 10-15 row table.
+    """
+    if len(scored) > n:
+        cut = len(scored) - n
+        keep = np.argpartition(scored['adj_score'].to_numpy(), cut)[cut:]
+        scored = scored.iloc[keep]
+    return scored.sort_values(['adj_score','vorp','proj_points'], ascending=[False, False, False])
 
 def compute_my_need_states(roster_slots, bench_slots, my_counts):
     """
@@ -187,16 +282,16 @@ def compute_my_need_states(roster_slots, bench_slots, my_counts):
     Note: FLEX logic: if any FLEX slots > 0 and position in RB/WR/TE, treat as 'need' until FLEX filled.
     """
     states = {}
-    # Count flex capacity consumed (we derive from my_counts['FLEX'])
+    # Count flex capacity consumed (we derive from my_counts[POS_IDX['FLEX']])
     flex_accept = {'RB','WR','TE'}
     flex_total = roster_slots.get('FLEX', 0)
-    flex_used = my_counts.get('FLEX', 0)
+    flex_used = int(my_counts[POS_IDX['FLEX']])
     flex_left = max(flex_total - flex_used, 0)
 
     for pos in BASE_POSITIONS:
         starters = roster_slots.get(pos, 0)
         bench = bench_slots.get(pos, 0)
-        used = my_counts.get(pos, 0)
+        used = int(my_counts[POS_IDX[pos]])
 
         # Determine starter need
         if used < starters:
@@ -216,7 +311,7 @@ def compute_my_need_states(roster_slots, bench_slots, my_counts):
 def printable_table(df, topn=15):
     if df.empty:
         return "No players left."
-    show = df.head(topn).copy()
+    show = top_candidates(df, topn).copy()
     show['proj_points'] = show['proj_points'].map(lambda x: f"{x:.2f}")
     show['vorp'] = show['vorp'].map(lambda x: f"{x:.2f}")
     if 'z_med' in show.columns:
@@ -242,32 +337,98 @@ def write_state(path, csv_path, teams, roster_slots, bench_slots, weights, topn,
         'weights': dict(weights),
         'top': topn,
         'drafted': [{'act': a, 'name': n, 'pos': p} for (a,n,p) in drafted],
-        'my_counts': dict(my_counts),
+        'my_counts': {p: int(my_counts[i]) for p, i in POS_IDX.items() if my_counts[i]},
     }
     os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    # Saves happen after every action, so keep them cheap (compact dump,
+    # orjson when installed) and atomic (temp file + replace) so a crash
+    # mid-write can't destroy a multi-day draft.
+    tmp = path + '.tmp'
+    if HAS_ORJSON:
+        with open(tmp, 'wb') as f:
+            f.write(orjson.dumps(data))
+    else:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp, path)
+    # a full snapshot subsumes any pending appended actions
+    try:
+        os.remove(path + '.log')
+    except OSError:
+        pass
+
+def append_state_action(path, act, name, pos, bucket=None):
+    """
+    O(1) per-mutation persistence: append one JSON line describing the action
+    to <state>.log instead of rewriting the whole snapshot after every pick.
+    write_state() folds the log into the next full snapshot and clears it;
+    read_state() replays pending lines on load. 'bucket' records which roster
+    counter a 'mine' pick consumed (position, or 'FLEX').
+    """
+    rec = {'act': act, 'name': name, 'pos': pos}
+    if bucket is not None:
+        rec['bucket'] = bucket
+    if HAS_ORJSON:
+        line = orjson.dumps(rec) + b'\n'
+    else:
+        line = (json.dumps(rec, separators=(',', ':')) + '\n').encode('utf-8')
+    with open(path + '.log', 'ab') as f:
+        f.write(line)
 
 def read_state(path):
     """
-    Load draft state JSON from 'path'. Returns dict or raises.
+    Load draft state JSON from 'path', replaying any actions appended to
+    <state>.log since the last full snapshot. A log without a snapshot --
+    first session crashed before any clean quit wrote one -- replays onto
+    an empty state so those picks still survive. Returns dict or raises.
+    """
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            raw = f.read()
+        st = orjson.loads(raw) if HAS_ORJSON else json.loads(raw.decode('utf-8'))
+    else:
+        st = {'drafted': [], 'my_counts': {}}
+    log = path + '.log'
+    if os.path.exists(log):
+        with open(log, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                rec = orjson.loads(line) if HAS_ORJSON else json.loads(line.decode('utf-8'))
+                act = rec.get('act')
+                if act == 'undo':
+                    if st.get('drafted'):
+                        st['drafted'].pop()
+                    continue
+                st.setdefault('drafted', []).append({'act': act, 'name': rec.get('name'), 'pos': rec.get('pos')})
+                if act == 'mine' and rec.get('bucket'):
+                    mc = st.setdefault('my_counts', {})
+                    mc[rec['bucket']] = mc.get(rec['bucket'], 0) + 1
+    return st
+
+def compute_pool_scores(df_all, avail_mask, my_counts, teams, roster_slots, bench_slots, weights):
+    """
+    The recomputation shared by 'best'/picks, 'filter', and 'save':
+    available pool, replacement levels, and the (unsorted) scored frame.
+    main memoizes this on (drafted_epoch, my_counts_epoch), so commands
+    that don't change state ('best', repeated 'filter') hit the cache.
     """
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # avail_mask is maintained incrementally (one bit flipped per pick/undo),
+    # and df_all is already sorted, so this is a plain boolean take -- no
+    # per-recalc isin scan or re-sort.
+    available = df_all[avail_mask]
+    replacement_points = compute_replacement_points(available, teams, roster_slots)
+    need_states = compute_my_need_states(roster_slots, bench_slots, my_counts)
+    scored = candidate_scores(available, replacement_points, need_states, weights, sort=False)
+    return available, replacement_points, scored
 
-def recalc_and_show(df_all, drafted, my_counts, teams, roster_slots, bench_slots, weights, topn):
-    available = df_all[~df_all['player'].isin(drafted)].copy().sort_values('proj_points', ascending=False)
+def recalc_and_show(pool, topn):
+    available, replacement_points, scored = pool
     if available.empty:
         print("\nDraft complete. No players left.")
         return False
 
-    # compute replacement
-    replacement_points = compute_replacement_points(available, teams, roster_slots)
-    # compute my need states
-    need_states = compute_my_need_states(roster_slots, bench_slots, my_counts)
-    # compute scores
-    scored = candidate_scores(available, replacement_points, need_states, weights)
-
     print("\nBest next picks (VORP-adjusted):")
     print(printable_table(scored, topn=topn))
 
@@ -281,7 +442,7 @@ def recalc_and_show(df_all, drafted, my_counts, teams, roster_slots, bench_slots
     # short position leaders (top 3)
     print("\nBy position (top 3 each by adj_score):")
     for pos in BASE_POSITIONS:
-        posdf = scored[scored['position']==pos].head(3)
+        posdf = top_candidates(scored[scored['position']==pos], 3)
         if not posdf.empty:
             s = ", ".join([f"{r.player} ({r.proj_points:.1f}; VORP {r.vorp:.1f})" for r in posdf.itertuples()])
             print(f"  {pos:>4}: {s}")
@@ -342,13 +503,57 @@ def main():
         print(f"ERROR: {e}")
         sys.exit(1)
 
-    all_names = df['player'].tolist()
+    # Interned names hash/compare by pointer in the lookup dict below
+    all_names = [sys.intern(n) for n in df['player'].tolist()]
+    row_of = {name: i for i, name in enumerate(all_names)}
+    suggest_cache = {}
+
+    def suggest(query):
+        # Fuzzy matching is the slowest per-keystroke step; memoize it so a
+        # repeated typo (common when copying from a broadcast) is free.
+        hits = suggest_cache.get(query)
+        if hits is None:
+            hits = get_close_matches(query, all_names, n=5, cutoff=0.6)
+            suggest_cache[query] = hits
+        return hits
     drafted = []   # order-sensitive for undo
     drafted_set = set()
-    my_counts = defaultdict(int)  # counts per position, plus 'FLEX' we increment when used
-
-    # Load state if provided
-    if args.state and os.path.exists(args.state):
+    # Persistent availability mask: one bit per pool row, flipped on each
+    # pick/undo instead of re-scanning every name on every recalc
+    avail_mask = np.ones(len(df), dtype=bool)
+    # Fixed-size counter array indexed by POS_IDX (base positions + FLEX):
+    # per-pick updates are a constant-index store, no dict machinery
+    my_counts = np.zeros(len(POS_IDX), dtype=np.int8)
+
+    # Memoize the shared recompute on state epochs: 'best', 'filter', and
+    # 'save' between picks reuse the same scored pool instead of rescoring
+    epochs = {'drafted': 0, 'mine': 0}
+    score_cache = {'key': None, 'pool': None}
+
+    def get_scores():
+        key = (epochs['drafted'], epochs['mine'])
+        if score_cache['key'] != key:
+            score_cache['pool'] = compute_pool_scores(
+                df, avail_mask, my_counts, args.teams, roster_slots, bench_slots, weights)
+            score_cache['key'] = key
+        return score_cache['pool']
+
+    def get_pos_scores(pos):
+        # Lazy per-position views of the memoized scored pool: repeated
+        # 'filter' commands between picks slice a cached subframe instead
+        # of rescanning every row with a boolean mask each time. Built on
+        # first use per epoch so picks that never filter pay nothing.
+        pool = get_scores()
+        if score_cache.get('by_pos_key') != score_cache['key']:
+            _, _, scored = pool
+            score_cache['by_pos'] = dict(iter(scored.groupby('position', observed=True)))
+            score_cache['by_pos_key'] = score_cache['key']
+        sub = score_cache['by_pos'].get(pos)
+        return sub if sub is not None else pool[2].iloc[0:0]
+
+    # Load state if provided; an orphan .log (crash before the first clean
+    # quit) counts as state too
+    if args.state and (os.path.exists(args.state) or os.path.exists(args.state + '.log')):
         try:
             st = read_state(args.state)
             # basic sanity: warn if csv differs
@@ -357,7 +562,14 @@ def main():
             # restore drafted and counts
             drafted = [(d.get('act'), d.get('name'), d.get('pos')) for d in st.get('drafted', [])]
             drafted_set = set([n for _, n, _ in drafted])
-            my_counts = defaultdict(int, st.get('my_counts', {}))
+            for n in drafted_set:
+                i = row_of.get(n)
+                if i is not None:
+                    avail_mask[i] = False
+            my_counts = np.zeros(len(POS_IDX), dtype=np.int8)
+            for p, v in st.get('my_counts', {}).items():
+                if p in POS_IDX:
+                    my_counts[POS_IDX[p]] = v
             print(f"Loaded draft state from {args.state} with {len(drafted)} actions.")
         except Exception as e:
             print(f"WARNING: Failed to load state from {args.state}: {e}. Starting fresh.")
@@ -365,161 +577,183 @@ def main():
     print(f"Loaded {len(df)} players from {args.csv}. Teams={args.teams}. Roster={roster_slots}. Bench={bench_slots}.")
     print(HELP_TEXT.strip())
 
-    if not recalc_and_show(df, drafted_set, my_counts, args.teams, roster_slots, bench_slots, weights, args.top):
+    if not recalc_and_show(get_scores(), args.top):
         return
 
-    while True:
-        try:
-            line = input("\n> ").strip()
-        except (EOFError, KeyboardInterrupt):
-            print("\nExiting.")
-            if args.state:
-                try:
-                    write_state(args.state, args.csv, args.teams, roster_slots, bench_slots, weights, args.top, drafted, my_counts)
-                    print(f"Saved state to {args.state}")
-                except Exception as e:
-                    print(f"WARNING: Failed to save state: {e}")
-            break
-        if not line:
-            continue
-        low = line.lower()
-
-        if low in ('q','quit','exit'):
-            if args.state:
-                try:
-                    write_state(args.state, args.csv, args.teams, roster_slots, bench_slots, weights, args.top, drafted, my_counts)
-                    print(f"Saved state to {args.state}")
-                except Exception as e:
-                    print(f"WARNING: Failed to save state: {e}")
-            break
-        if low in ('h','help','?'):
-            print(HELP_TEXT.strip())
-            continue
-        if low == 'best':
-            recalc_and_show(df, drafted_set, my_counts, args.teams, roster_slots, bench_slots, weights, args.top)
-            continue
-        if low == 'status':
-            print("Your roster used: " + ", ".join([f"{k}:{v}" for k,v in sorted(my_counts.items())]))
-            print(f"Weights: {weights}")
-            # show need states
-            ns = compute_my_need_states(roster_slots, bench_slots, my_counts)
-            print("Need states: " + ", ".join([f"{k}:{ns[k]}" for k in BASE_POSITIONS]))
-            continue
-        if low == 'undo':
-            if not drafted:
-                print("Nothing to undo.")
-                continue
-            act, name, pos = drafted.pop()
-            if act == 'drafted':
-                if name in drafted_set:
-                    drafted_set.remove(name)
-                print(f"Undid drafted: {name}")
-            else:
-                print("Undo for 'mine' not yet implemented.")
-            if args.state:
-                try:
-                    write_state(args.state, args.csv, args.teams, roster_slots, bench_slots, weights, args.top, drafted, my_counts)
-                    print(f"Saved state to {args.state}")
-                except Exception as e:
-                    print(f"WARNING: Failed to save state: {e}")
-            continue
-        if low.startswith('save '):
-            path = line.split(None,1)[1]
-            avail = df[~df['player'].isin(drafted_set)].copy()
-            # compute scored table for saving
-            replacement_points = compute_replacement_points(avail, args.teams, roster_slots)
-            need_states = compute_my_need_states(roster_slots, bench_slots, my_counts)
-            scored = candidate_scores(avail, replacement_points, need_states, weights)
-            scored.to_csv(path, index=False)
-            print(f"Saved remaining pool with scores to {path}")
-            continue
-        if low.startswith('save-state '):
-            path = line.split(None,1)[1]
+    def save_state_quiet():
+        if args.state:
             try:
-                write_state(path, args.csv, args.teams, roster_slots, bench_slots, weights, args.top, drafted, my_counts)
-                print(f"Saved state to {path}")
+                write_state(args.state, args.csv, args.teams, roster_slots, bench_slots, weights, args.top, drafted, my_counts)
+                print(f"Saved state to {args.state}")
             except Exception as e:
-                print(f"ERROR: Failed to save state: {e}")
-            continue
-        if low.startswith('filter '):
-            pos = line.split(None,1)[1].strip().upper()
-            if pos in DEF_ALIASES:
-                pos = 'DST'
-            if pos not in BASE_POSITIONS:
-                print(f"Unknown position '{pos}'. Use one of {BASE_POSITIONS}.")
-                continue
-            avail = df[~df['player'].isin(drafted_set)].copy()
-            replacement_points = compute_replacement_points(avail, args.teams, roster_slots)
-            need_states = compute_my_need_states(roster_slots, bench_slots, my_counts)
-            scored = candidate_scores(avail, replacement_points, need_states, weights)
-            posdf = scored[scored['position']==pos].head(10)
-            if posdf.empty:
-                print(f"No players left at {pos}.")
-            else:
-                print(printable_table(posdf, topn=10))
-            continue
+                print(f"WARNING: Failed to save state: {e}")
 
-        # "mine <name>"
-        if low.startswith('mine '):
-            name = line.split(None,1)[1].strip()
-            # exact first
-            if name not in all_names:
-                suggestions = get_close_matches(name, all_names, n=5, cutoff=0.6)
-                if suggestions:
-                    print(f"Name not found. Did you mean: {', '.join(suggestions)} ?")
-                    continue
-                else:
-                    print("Name not found. Check spelling.")
-                    continue
-            if name in drafted_set:
-                print(f"Already drafted: {name}")
-                continue
-            # get pos
-            pos = df[df['player']==name].iloc[0]['position']
-            drafted.append(('mine', name, pos))
-            drafted_set.add(name)
-            # increment my roster counts: prefer filling starters; if starters full and FLEX available for RB/WR/TE, consume FLEX; else bench.
-            pos_upper = pos.upper()
-            flex_accept = {'RB','WR','TE'}
-            starters = roster_slots.get(pos_upper, 0)
-            if my_counts[pos_upper] < starters:
-                my_counts[pos_upper] += 1
-            elif pos_upper in flex_accept and my_counts.get('FLEX',0) < roster_slots.get('FLEX',0):
-                my_counts['FLEX'] = my_counts.get('FLEX',0) + 1
-            else:
-                my_counts[pos_upper] += 1  # bench
-            recalc_and_show(df, drafted_set, my_counts, args.teams, roster_slots, bench_slots, weights, args.top)
-            if args.state:
-                try:
-                    write_state(args.state, args.csv, args.teams, roster_slots, bench_slots, weights, args.top, drafted, my_counts)
-                    print(f"Saved state to {args.state}")
-                except Exception as e:
-                    print(f"WARNING: Failed to save state: {e}")
-            continue
+    def log_action(act, name, pos, bucket=None):
+        if args.state:
+            try:
+                append_state_action(args.state, act, name, pos, bucket=bucket)
+            except Exception as e:
+                print(f"WARNING: Failed to log state action: {e}")
 
-        # otherwise treat as league drafted name
-        name = line.strip()
-        if name not in all_names:
-            suggestions = get_close_matches(name, all_names, n=5, cutoff=0.6)
+    def draft_league(name):
+        if name not in row_of:
+            suggestions = suggest(name)
             if suggestions:
                 print(f"Name not found. Did you mean: {', '.join(suggestions)} ?")
-                continue
             else:
                 print("Name not found. Check spelling.")
-                continue
+            return
         if name in drafted_set:
             print(f"Already drafted: {name}")
-            continue
+            return
         pos = df[df['player']==name].iloc[0]['position']
         drafted.append(('drafted', name, pos))
         drafted_set.add(name)
-        recalc_and_show(df, drafted_set, my_counts, args.teams, roster_slots, bench_slots, weights, args.top)
-        if args.state:
-            try:
-                write_state(args.state, args.csv, args.teams, roster_slots, bench_slots, weights, args.top, drafted, my_counts)
-                print(f"Saved state to {args.state}")
-            except Exception as e:
-                print(f"WARNING: Failed to save state: {e}")
+        avail_mask[row_of[name]] = False
+        epochs['drafted'] += 1
+        recalc_and_show(get_scores(), args.top)
+        log_action('drafted', name, pos)
+
+    def cmd_quit(rest):
+        save_state_quiet()
+        return False
+
+    def cmd_help(rest):
+        print(HELP_TEXT.strip())
+
+    def cmd_best(rest):
+        recalc_and_show(get_scores(), args.top)
+
+    def cmd_status(rest):
+        print("Your roster used: " + ", ".join([f"{p}:{my_counts[i]}" for p, i in POS_IDX.items() if my_counts[i]]))
+        print(f"Weights: {weights}")
+        # show need states
+        ns = compute_my_need_states(roster_slots, bench_slots, my_counts)
+        print("Need states: " + ", ".join([f"{k}:{ns[k]}" for k in BASE_POSITIONS]))
+
+    def cmd_undo(rest):
+        if not drafted:
+            print("Nothing to undo.")
+            return
+        act, name, pos = drafted.pop()
+        if act == 'drafted':
+            if name in drafted_set:
+                drafted_set.remove(name)
+                i = row_of.get(name)
+                if i is not None:
+                    avail_mask[i] = True
+                    epochs['drafted'] += 1
+            print(f"Undid drafted: {name}")
+        else:
+            print("Undo for 'mine' not yet implemented.")
+        log_action('undo', name, pos)
+
+    def cmd_save(rest):
+        if not rest:
+            print("Usage: save /path/to/remaining.csv")
+            return
+        _, _, scored = get_scores()
+        scored = scored.sort_values(['adj_score','vorp','proj_points'],
+                                    ascending=[False, False, False])
+        scored.to_csv(rest, index=False)
+        print(f"Saved remaining pool with scores to {rest}")
+
+    def cmd_save_state(rest):
+        if not rest:
+            print("Usage: save-state /path/to/state.json")
+            return
+        try:
+            write_state(rest, args.csv, args.teams, roster_slots, bench_slots, weights, args.top, drafted, my_counts)
+            print(f"Saved state to {rest}")
+        except Exception as e:
+            print(f"ERROR: Failed to save state: {e}")
+
+    def cmd_filter(rest):
+        pos = rest.strip().upper()
+        if pos in DEF_ALIASES:
+            pos = 'DST'
+        if pos not in BASE_POSITIONS:
+            print(f"Unknown position '{pos}'. Use one of {BASE_POSITIONS}.")
+            return
+        posdf = top_candidates(get_pos_scores(pos), 10)
+        if posdf.empty:
+            print(f"No players left at {pos}.")
+        else:
+            print(printable_table(posdf, topn=10))
+
+    def cmd_mine(rest):
+        name = rest.strip()
+        if not name:
+            print("Usage: mine <player name>")
+            return
+        # exact first
+        if name not in row_of:
+            suggestions = suggest(name)
+            if suggestions:
+                print(f"Name not found. Did you mean: {', '.join(suggestions)} ?")
+            else:
+                print("Name not found. Check spelling.")
+            return
+        if name in drafted_set:
+            print(f"Already drafted: {name}")
+            return
+        # get pos
+        pos = df[df['player']==name].iloc[0]['position']
+        drafted.append(('mine', name, pos))
+        drafted_set.add(name)
+        avail_mask[row_of[name]] = False
+        epochs['drafted'] += 1
+        epochs['mine'] += 1
+        # increment my roster counts: prefer filling starters; if starters full and FLEX available for RB/WR/TE, consume FLEX; else bench.
+        pos_upper = pos.upper()
+        flex_accept = {'RB','WR','TE'}
+        starters = roster_slots.get(pos_upper, 0)
+        if my_counts[POS_IDX[pos_upper]] < starters:
+            my_counts[POS_IDX[pos_upper]] += 1
+            bucket = pos_upper
+        elif pos_upper in flex_accept and my_counts[POS_IDX['FLEX']] < roster_slots.get('FLEX',0):
+            my_counts[POS_IDX['FLEX']] += 1
+            bucket = 'FLEX'
+        else:
+            my_counts[POS_IDX[pos_upper]] += 1  # bench
+            bucket = pos_upper
+        recalc_and_show(get_scores(), args.top)
+        log_action('mine', name, pos, bucket=bucket)
+
+    # Single-token dispatch: one dict lookup on the first word replaces the
+    # chain of startswith tests per line, which matters when replaying a
+    # long action log through the same loop. Unknown words fall through to
+    # "league drafted <name>".
+    commands = {
+        'q': cmd_quit, 'quit': cmd_quit, 'exit': cmd_quit,
+        'h': cmd_help, 'help': cmd_help, '?': cmd_help,
+        'best': cmd_best,
+        'status': cmd_status,
+        'undo': cmd_undo,
+        'save': cmd_save,
+        'save-state': cmd_save_state,
+        'filter': cmd_filter,
+        'mine': cmd_mine,
+    }
+
+    while True:
+        try:
+            line = input("\n> ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print("\nExiting.")
+            save_state_quiet()
+            break
+        if not line:
+            continue
+        parts = line.split(None, 1)
+        handler = commands.get(parts[0].lower())
+        if handler is not None:
+            if handler(parts[1] if len(parts) > 1 else '') is False:
+                break
+            continue
+
+        # otherwise treat as league drafted name
+        draft_league(line)
 
 if __name__ == '__main__':
     main()
@@ -13,21 +13,39 @@ PAGE_SIZE = 50           # ESPN paginates UI by 50 (not critical here)
 # Positions we care about
 POS_MAP = {1:"QB", 2:"RB", 3:"WR", 4:"TE", 5:"K", 16:"DST"}
 
-def pick_projection(stats, week=0):
-    """Return ESPN’s own projection (no manual summing)."""
-    want_split = 1 if week > 0 else 0
+def build_projection_index(stats):
+    """
+    One pass over a player's stats building a dict keyed by
+    (statSourceId, statSplitTypeId, scoringPeriodId) -> applied points,
+    plus a (statSourceId, statSplitTypeId) key for season lookups.
+    Entries without a value are skipped so the first *valued* entry per
+    key wins, matching the old linear scan.
+    """
+    idx = {}
     for s in stats or []:
-        if s.get("statSourceId") != 1:         # projections only
-            continue
-        if s.get("statSplitTypeId") != want_split:  # 0=season, 1=weekly
-            continue
-        if week > 0 and s.get("scoringPeriodId") != week:
-            continue
         if s.get("appliedTotal") is not None:
-            return float(s["appliedTotal"])
-        if s.get("appliedAverage") is not None:
-            return float(s["appliedAverage"])
-    return None
+            val = float(s["appliedTotal"])
+        elif s.get("appliedAverage") is not None:
+            val = float(s["appliedAverage"])
+        else:
+            continue
+        source, split = s.get("statSourceId"), s.get("statSplitTypeId")
+        idx.setdefault((source, split, s.get("scoringPeriodId")), val)
+        idx.setdefault((source, split), val)
+    return idx
+
+def pick_projection(stats, week=0):
+    """Return ESPN’s own projection (no manual summing)."""
+    idx = build_projection_index(stats)
+    if week > 0:
+        return idx.get((1, 1, week))       # 1=projection source, 1=weekly split
+    return idx.get((1, 0))                 # season split, any scoring period
+
+try:
+    import httpx  # type: ignore
+    HAS_HTTPX = True
+except Exception:
+    HAS_HTTPX = False
 
 def fetch_json(url, headers=None, timeout=60):
     req = Request(url, headers=headers or {})
@@ -35,72 +53,96 @@ def fetch_json(url, headers=None, timeout=60):
         data = resp.read().decode("utf-8", errors="replace")
         return json.loads(data)
 
-async def grab_players_json(page):
+async def fetch_json_many(requests_list, timeout=60):
+    """
+    Fetch several (url, headers) pairs concurrently over one HTTP/2
+    connection (httpx.AsyncClient + gather): a per-week projection pull
+    (weeks 1-18) costs ~one RTT instead of 18 sequential TCP+TLS
+    handshakes. Falls back to sequential urlopen when httpx is missing.
+    Returns payloads in the same order as requests_list.
     """
-    Navigate and capture the JSON XHR the page makes to ESPN's players API.
+    if not HAS_HTTPX:
+        return [fetch_json(url, headers=headers, timeout=timeout)
+                for url, headers in requests_list]
+
+    async with httpx.AsyncClient(http2=True, timeout=timeout) as client:
+        async def one(url, headers):
+            r = await client.get(url, headers=headers)
+            r.raise_for_status()
+            return r.json()
+        return await asyncio.gather(*[one(u, h) for u, h in requests_list])
+
+def fetch_players_payload():
     """
+    Fetch the full projections payload straight from ESPN's players API.
+    No browser needed: the endpoint only wants the x-fantasy-filter header.
+    """
+    xf = {
+        "players": {
+            "filterStatsForExternalIds": {"value": [2024, SEASON_ID]},
+            "filterSlotIds": {"value": [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,23,24]},
+            "filterStatsForSourceIds": {"value": [0,1]},
+            "useFullProjectionTable": {"value": True},
+            "sortAppliedStatTotal": {"sortAsc": False, "sortPriority": 3, "value": "102025"},
+            "sortDraftRanks": {"sortPriority": 2, "sortAsc": True, "value": "PPR"},
+            "sortPercOwned": {"sortPriority": 4, "sortAsc": False},
+            "limit": 5000,
+            "filterRanksForSlotIds": {"value": [0,2,4,6,17,16,8,9,10,12,13,24,11,14,15]},
+            "filterStatsForTopScoringPeriodIds": {"value": 2, "additionalValue": ["002025","102025","002024","022025"]}
+        }
+    }
+    league_url = f"https://lm-api-reads.fantasy.espn.com/apis/v3/games/ffl/seasons/{SEASON_ID}/segments/0/leaguedefaults/3?view=kona_player_info"
+    headers = {
+        "User-Agent": "Mozilla/5.0",
+        "Referer": BASE_URL,
+        "x-fantasy-filter": json.dumps(xf, separators=(",", ":"))
+    }
+    data = fetch_json(league_url, headers=headers)
+    if isinstance(data, dict) and isinstance(data.get("players"), list) and data["players"]:
+        print("Fetched league defaults players:", len(data["players"]))
+        return data
+    raise RuntimeError("players API returned no players")
+
+async def grab_players_json_via_browser():
+    """
+    Fallback only: drive a headless browser and capture the JSON XHR the
+    projections page makes, in case the direct API call starts being rejected.
+    """
+    from playwright.async_api import async_playwright
+
     def is_players_api(resp):
         u = resp.url
         return ("/apis/v3/games/ffl" in u) and ("/players" in u) and ("view=" in u)
 
-    # Minimal page initialization
-    state = {}
-
-    # Set up the waiter BEFORE navigating
-    async with page.expect_response(is_players_api, timeout=120_000) as resp_info:
-        await page.goto(f"{BASE_URL}?seasonId={SEASON_ID}",
-                        wait_until="domcontentloaded", timeout=120_000)
-
-    resp = await resp_info.value
-    # Single rich fetch via direct HTTP
-    try:
-        xf = {
-            "players": {
-                "filterStatsForExternalIds": {"value": [2024, SEASON_ID]},
-                "filterSlotIds": {"value": [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,23,24]},
-                "filterStatsForSourceIds": {"value": [0,1]},
-                "useFullProjectionTable": {"value": True},
-                "sortAppliedStatTotal": {"sortAsc": False, "sortPriority": 3, "value": "102025"},
-                "sortDraftRanks": {"sortPriority": 2, "sortAsc": True, "value": "PPR"},
-                "sortPercOwned": {"sortPriority": 4, "sortAsc": False},
-                "limit": 5000,
-                "filterRanksForSlotIds": {"value": [0,2,4,6,17,16,8,9,10,12,13,24,11,14,15]},
-                "filterStatsForTopScoringPeriodIds": {"value": 2, "additionalValue": ["002025","102025","002024","022025"]}
-            }
-        }
-        league_url = f"https://lm-api-reads.fantasy.espn.com/apis/v3/games/ffl/seasons/{SEASON_ID}/segments/0/leaguedefaults/3?view=kona_player_info"
-        headers = {
-            "User-Agent": "Mozilla/5.0",
-            "Referer": BASE_URL,
-            "x-fantasy-filter": json.dumps(xf, separators=(",", ":"))
-        }
-        data = fetch_json(league_url, headers=headers)
-        try:
-            print("Fetched league defaults players:", len(data.get("players", [])))
-        except Exception:
-            pass
-        if isinstance(data, dict) and isinstance(data.get("players"), list) and data["players"]:
-            return data
-    except Exception as e:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page(user_agent=(
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/120.0.0.0 Safari/537.36"
+        ))
+        # Set up the waiter BEFORE navigating
+        async with page.expect_response(is_players_api, timeout=120_000) as resp_info:
+            await page.goto(f"{BASE_URL}?seasonId={SEASON_ID}",
+                            wait_until="domcontentloaded", timeout=120_000)
+        resp = await resp_info.value
         try:
-            print("league defaults fetch error:", repr(e))
+            payload = await resp.json()
         except Exception:
-            pass
+            payload = json.loads(await resp.text())
+        await browser.close()
+        return payload
 
-    # Fallback: return whatever the original players request returned
-    try:
-        return await resp.json()
-    except Exception:
-        txt = await resp.text()
-        return json.loads(txt)
+ROW_COLUMNS = ["player_id", "name", "position", "projected_points"]
 
 def extract_rows(payload, week=0):
     """
     Handle payload being either a list of players or an object with 'players'.
-    Only return (name, position, projected_points) for fantasy positions.
+    Single-pass generator yielding one flat tuple per fantasy-position player
+    (ordered as ROW_COLUMNS); feed it to pd.DataFrame.from_records instead of
+    accumulating a list of per-row dicts.
     """
     items = payload if isinstance(payload, list) else payload.get("players", [])
-    out = []
     for item in items:
         p = item.get("player") if isinstance(item, dict) and "player" in item else item
         if not isinstance(p, dict):
@@ -108,42 +150,28 @@ def extract_rows(payload, week=0):
         pos_id = p.get("defaultPositionId")
         if pos_id not in POS_MAP:
             continue
-        stats_list = p.get("stats", [])
-        pts = pick_projection(stats_list, week=week)
+        pts = pick_projection(p.get("stats", []), week=week)
         if pts is None:
             continue
         name = p.get("fullName") or p.get("name") or ""
-        out.append({"player_id": p.get("id"), "name": name, "position": POS_MAP[pos_id], "projected_points": pts})
-    return out
+        yield (p.get("id"), name, POS_MAP[pos_id], pts)
 
-async def main():
-    # Use Playwright only to capture filter if needed, but our fetch uses direct HTTP
-    from playwright.async_api import async_playwright
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page(user_agent=(
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ))
-        payload = await grab_players_json(page)
-        await browser.close()
+def main():
+    # 1) Direct HTTPS fetch; the browser bootstrap is only a fallback
+    try:
+        payload = fetch_players_payload()
+    except Exception as e:
+        print("direct fetch failed:", repr(e), "- falling back to browser capture")
+        payload = asyncio.run(grab_players_json_via_browser())
 
     # 2) Parse as season totals (week=0)
-    rows = extract_rows(payload, week=0)
-
-    # 3) De-dup and save
-    seen = set()
-    dedup = []
-    for r in rows:
-        pid = r.get("player_id")
-        key = pid if pid is not None else (r["name"], r["position"]) 
-        if key in seen: 
-            continue
-        seen.add(key)
-        dedup.append(r)
+    df = pd.DataFrame.from_records(extract_rows(payload, week=0), columns=ROW_COLUMNS)
 
-    df = pd.DataFrame(dedup)
+    # 3) De-dup in-frame: by player_id when present, else by (name, position)
+    if not df.empty:
+        fallback = df["name"].astype(str) + "|" + df["position"].astype(str)
+        key = df["player_id"].astype(object).where(df["player_id"].notna(), fallback)
+        df = df.loc[~key.duplicated()].reset_index(drop=True)
     if not df.empty:
         df.sort_values("projected_points", ascending=False, inplace=True, ignore_index=True)
 
@@ -154,4 +182,4 @@ async def main():
         print(df.head(15).to_string(index=False))
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -2,6 +2,7 @@ import argparse
 import glob
 import os
 from datetime import datetime
+from functools import lru_cache
 
 import pandas as pd
 import numpy as np
@@ -12,6 +13,12 @@ try:
 except Exception:
     HAS_SEABORN = False
 
+try:
+    from numba import njit  # type: ignore
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
 import matplotlib.pyplot as plt
 
 
@@ -47,7 +54,9 @@ def infer_season_from_filename(path: str) -> str | None:
     return None
 
 
+@lru_cache(maxsize=None)
 def _gaussian_kernel(sigma_bins: float) -> np.ndarray:
+    # Cached: the overlay loop asks for the same sigma once per position
     sigma = max(1e-6, float(sigma_bins))
     radius = int(max(3, round(3 * sigma)))
     xs = np.arange(-radius, radius + 1, dtype=float)
@@ -56,6 +65,32 @@ def _gaussian_kernel(sigma_bins: float) -> np.ndarray:
     return k
 
 
+def _convolve_same(counts: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    # Same-mode convolution written as a plain loop so numba can compile it
+    # with fastmath SIMD; matches np.convolve(counts, kernel, mode="same")
+    n = counts.shape[0]
+    m = kernel.shape[0]
+    half = m // 2
+    out = np.zeros(n)
+    for i in range(n):
+        acc = 0.0
+        for j in range(m):
+            k = i + half - j
+            if 0 <= k < n:
+                acc += counts[k] * kernel[j]
+        out[i] = acc
+    return out
+
+if HAS_NUMBA:
+    _convolve_same = njit(cache=True, fastmath=True)(_convolve_same)
+
+
+def smooth_counts(counts: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    if HAS_NUMBA:
+        return _convolve_same(np.ascontiguousarray(counts, dtype=float), kernel)
+    return np.convolve(counts, kernel, mode="same")
+
+
 def plot_position_distribution(
     df: pd.DataFrame,
     position: str,
@@ -67,8 +102,13 @@ def plot_position_distribution(
     min_points: float = 150.0,
     smooth_sigma: float = 2.5,
     bw_adjust: float = 1.0,
+    data: pd.Series | None = None,
 ) -> str:
-    data = df[df["position"] == position]["projected_points"].dropna()
+    # plot_all_positions passes each position's series from one shared
+    # groupby; the boolean mask remains for direct single-position calls
+    if data is None:
+        data = df[df["position"] == position]["projected_points"]
+    data = data.dropna()
     # Apply threshold filter
     data = data[data > min_points]
     if data.empty:
@@ -77,9 +117,13 @@ def plot_position_distribution(
     os.makedirs(out_dir, exist_ok=True)
     fig, ax = plt.subplots(figsize=(8, 5))
 
-    upper = data.quantile(clip_quantile) if 0 < clip_quantile < 1 else data.max()
-    lower = max(0.0, data.min())
-    plot_data = data.clip(lower=lower, upper=upper)
+    dmin = float(data.min())
+    dmax = float(data.max())
+    upper = float(data.quantile(clip_quantile)) if 0 < clip_quantile < 1 else dmax
+    lower = max(0.0, dmin)
+    # Only pay for the clip when something is actually out of range --
+    # usually just the top tail, often nothing at all
+    plot_data = data.clip(lower=lower, upper=upper) if (dmin < lower or dmax > upper) else data
 
     title_season = f" {season}" if season else ""
     title = f"Projected Points Distribution - {position}{title_season}"
@@ -99,7 +143,7 @@ def plot_position_distribution(
         centers = 0.5 * (edges[:-1] + edges[1:])
         if kde and smooth_sigma and smooth_sigma > 0:
             kernel = _gaussian_kernel(smooth_sigma)
-            counts = np.convolve(counts, kernel, mode="same")
+            counts = smooth_counts(counts, kernel)
         ax.plot(centers, counts, color="#4C78A8", linewidth=1.8)
         ax.fill_between(centers, 0, counts, color="#4C78A8", alpha=0.18)
 
@@ -145,16 +189,19 @@ def plot_overlay_distribution(
     df = df[df["projected_points"] > min_points]
 
     # Compute global clip so overlays share an x-limits
-    upper = df["projected_points"].quantile(clip_quantile) if 0 < clip_quantile < 1 else df["projected_points"].max()
+    dmax = float(df["projected_points"].max()) if len(df) else 0.0
+    upper = float(df["projected_points"].quantile(clip_quantile)) if 0 < clip_quantile < 1 else dmax
     lower = float(min_points)
-    df["projected_points"] = df["projected_points"].clip(lower=lower, upper=upper)
+    # Rows already satisfy > min_points, so only the upper tail can clip
+    if dmax > upper:
+        df["projected_points"] = df["projected_points"].clip(lower=lower, upper=upper)
 
-    # Keep common fantasy positions first
+    # Keep common fantasy positions first; scan the column for its labels
+    # once instead of re-running unique() per membership test
     preferred_order = ["QB", "RB", "WR", "TE", "K", "DST"]
-    order = [p for p in preferred_order if p in df["position"].unique().tolist()]
-    for p in df["position"].unique():
-        if p not in order:
-            order.append(p)
+    present = set(df["position"].dropna().unique())
+    order = [p for p in preferred_order if p in present]
+    order += [p for p in present if p not in preferred_order]
 
     os.makedirs(out_dir, exist_ok=True)
     fig, ax = plt.subplots(figsize=(10, 6))
@@ -189,13 +236,24 @@ def plot_overlay_distribution(
         xs = np.linspace(lower, upper, bins + 1)
         centers = 0.5 * (xs[:-1] + xs[1:])
         kernel = _gaussian_kernel(smooth_sigma) if kde and smooth_sigma and smooth_sigma > 0 else None
+        # Fused histograms: one linear scan bins every row into a
+        # (position, bin) count matrix, replacing K separate np.histogram
+        # passes over the same column
+        pos_row = {pos: i for i, pos in enumerate(order)}
+        codes = df["position"].map(pos_row).to_numpy(dtype=np.intp)
+        values = df["projected_points"].to_numpy(dtype=float)
+        bin_ids = np.clip(np.searchsorted(xs, values, side="right") - 1, 0, bins - 1)
+        hist2d = np.zeros((len(order), bins))
+        np.add.at(hist2d, (codes, bin_ids), 1.0)
+        bin_width = (upper - lower) / bins if upper > lower else 1.0
+        totals = hist2d.sum(axis=1)
         for i, pos in enumerate(order):
-            vals = df.loc[df["position"] == pos, "projected_points"].values
-            if len(vals) == 0:
+            if totals[i] == 0:
                 continue
-            hist, _ = np.histogram(vals, bins=xs, density=True)
+            # per-position density normalization, as np.histogram(density=True)
+            hist = hist2d[i] / (totals[i] * bin_width)
             if kernel is not None:
-                hist = np.convolve(hist, kernel, mode="same")
+                hist = smooth_counts(hist, kernel)
             c = colors(i % 10)
             ax.plot(centers, hist, color=c, label=pos, linewidth=1.8)
             ax.fill_between(centers, 0, hist, color=c, alpha=0.18)
@@ -214,37 +272,50 @@ def plot_overlay_distribution(
 
 
 def plot_all_positions(
-    csv_path: str,
-    out_dir: str,
+    csv_path: str | None = None,
+    out_dir: str = "charts",
     bins: str | int = "auto",
     clip_quantile: float = 0.995,
     kde: bool = True,
     min_points: float = 150.0,
     smooth_sigma: float = 2.5,
     bw_adjust: float = 1.0,
+    df: pd.DataFrame | None = None,
+    season: str | None = None,
 ) -> list[str]:
-    df = pd.read_csv(csv_path)
-    if not {"position", "projected_points"}.issubset(df.columns):
-        raise SystemExit("CSV must contain 'position' and 'projected_points' columns")
-
-    df = sanitize_positions(df)
+    # Accept a pre-loaded (sanitized) frame from main so the CSV isn't
+    # parsed twice per run; reading from csv_path remains for direct calls.
+    if df is None:
+        if not csv_path:
+            raise SystemExit("plot_all_positions needs a csv_path or a pre-loaded df")
+        # Only parse the two columns the charts use (a projections CSV
+        # carries many more); categorical position as in main
+        try:
+            df = pd.read_csv(csv_path, usecols=["position", "projected_points"],
+                             dtype={"position": "category"})
+        except ValueError:
+            raise SystemExit("CSV must contain 'position' and 'projected_points' columns")
+        df = sanitize_positions(df)
+    if season is None and csv_path:
+        season = infer_season_from_filename(csv_path)
     # Apply threshold filter once
     df = df[df["projected_points"] > min_points]
-    season = infer_season_from_filename(csv_path)
 
-    # Keep only common fantasy positions; preserve CSV’s positions order
+    # Keep only common fantasy positions; single unique() scan, set lookups
     preferred_order = ["QB", "RB", "WR", "TE", "K", "DST"]
-    positions = [p for p in preferred_order if p in df["position"].unique().tolist()]
+    present = set(df["position"].dropna().unique())
+    positions = [p for p in preferred_order if p in present]
     # Include any unknown positions at the end
-    for p in df["position"].unique():
-        if p not in positions:
-            positions.append(p)
+    positions += [p for p in present if p not in preferred_order]
 
     outputs: list[str] = []
+    # Single groupby builds all per-position slices up front
+    groups = {pos: vals for pos, vals in df.groupby("position", observed=True, sort=False)["projected_points"]}
     for pos in positions:
         path = plot_position_distribution(
             df,
             pos,
+            data=groups.get(pos),
             out_dir=out_dir,
             season=season,
             bins=bins,
@@ -332,9 +403,12 @@ def main():
     except Exception:
         bins = str(args.bins)
 
-    # Load once
-    df = pd.read_csv(input_csv)
-    if not {"position", "projected_points"}.issubset(df.columns):
+    # Load once, parsing only the two columns every chart consumes --
+    # read_csv skips the other ~20 columns entirely
+    try:
+        df = pd.read_csv(input_csv, usecols=["position", "projected_points"],
+                         dtype={"position": "category"})
+    except ValueError:
         raise SystemExit("CSV must contain 'position' and 'projected_points' columns")
     df = sanitize_positions(df)
     season = infer_season_from_filename(input_csv)
@@ -358,6 +432,8 @@ def main():
     if not args.overlay_only:
         sep_outputs = plot_all_positions(
             csv_path=input_csv,
+            df=df,
+            season=season,
             out_dir=args.out_dir,
             bins=(bins if isinstance(bins, (int,)) else "auto"),
             clip_quantile=args.clip_quantile,